@@ -4,13 +4,42 @@ Module for extracting weather data from an API using HTTP requests.
 This module provides helper functions to validate the API key and extract weather data.
 """
 
+import orjson
 import requests
 from datetime import datetime
+from typing import NamedTuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from logging_config import logger
 
 # load_dotenv(dotenv_path='api_key.env')  # Initialize API key environment variable
 # API_KEY = os.getenv('API_KEY')
 
+# Shared session so the connection pool and TLS sessions are reused between requests.
+# Every request goes to the same host, so a single pool sized for the concurrent
+# extraction workers is enough. Transient gateway errors are retried by urllib3.
+_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=_RETRY))
+
+class WeatherRow(NamedTuple):
+    """
+    Weather data record, with fields in the column order of the Weather_data INSERT.
+
+    Being a tuple, it can be bound directly as the parameters of the INSERT.
+    """
+    timestamp: str
+    city: str
+    country: str
+    current_temperature: float
+    max_temperature: float
+    min_temperature: float
+    description: str
+    cloud_percentage: int
+    humidity: int
+    visibility: int
+
 def validate_api_key(api_key) -> bool:
     """
     Validate the API key.
@@ -37,8 +66,9 @@ def extract_weather_data(api_url: str, api_key: str, city: str, params=None):
         params (dict, optional): Additional parameters for the API request.
 
     Returns:
-        dict: A dictionary containing weather data with keys:
-            - timestamp: Current datetime.
+        WeatherRow: A named tuple containing weather data, or None if the API key is
+        missing or the response lacks a required field. Fields:
+            - timestamp: Current local datetime as a 'YYYY-MM-DD HH:MM:SS' string.
             - city: Name of the city.
             - country: Country code.
             - current_temperature: Current temperature value.
@@ -59,32 +89,44 @@ def extract_weather_data(api_url: str, api_key: str, city: str, params=None):
     logger.info('Extraction started')
 
     try:
-        response = requests.get(api_url, params=params, timeout=10)
+        request_params = {'q': city, 'appid': api_key}
+        if params:
+            request_params.update(params)
+
+        response = _SESSION.get(api_url, params=request_params, timeout=10)
         response.raise_for_status()
-        data = response.json()
-
-        main_data = data.get('main', {})
-        weather_data = data.get('weather', [{}])[0]
-        clouds_data = data.get('clouds', {})
-        sys_data = data.get('sys', {})
-
-        weather_info = {
-            'timestamp': datetime.now(),
-            'city': data.get('name', 'unknown'),
-            'country': sys_data.get('country'),
-            'current_temperature': main_data.get('temp'),
-            'max_temperature': main_data.get('temp_max'),
-            'min_temperature': main_data.get('temp_min'),
-            'description': weather_data.get('description'),
-            'cloud_percentage': clouds_data.get('all'),
-            'humidity': main_data.get('humidity'),
-            'visibility': data.get('visibility')
-        }
+        # Parse the raw bytes with orjson, skipping the str decode and stdlib json.
+        data = orjson.loads(response.content)
+
+        # Bind the timestamp as text so sqlite3 does not run its datetime adapter.
+        timestamp = datetime.now().isoformat(sep=' ', timespec='seconds')
+
+        # The response schema is fixed, so read fields directly and treat any gap as invalid.
+        try:
+            main_data = data['main']
+            weather_data = data['weather'][0]
+            sys_data = data['sys']
+
+            weather_info = WeatherRow(
+                timestamp=timestamp,
+                city=data['name'],
+                country=sys_data['country'],
+                current_temperature=main_data['temp'],
+                max_temperature=main_data['temp_max'],
+                min_temperature=main_data['temp_min'],
+                description=weather_data['description'],
+                cloud_percentage=data['clouds']['all'],
+                humidity=main_data['humidity'],
+                visibility=data['visibility']
+            )
+        except (KeyError, IndexError, TypeError) as e:
+            logger.error('Missing field in API response: %r', e)
+            return
 
         return weather_info
     except requests.exceptions.RequestException as e:
-        logger.error(f'Error on HTTP request: {e}')
+        logger.error('Error on HTTP request: %s', e)
         raise
     except Exception as e:
-        logger.error(f'Something went wrong - {e}')
+        logger.error('Something went wrong - %s', e)
         raise
\ No newline at end of file
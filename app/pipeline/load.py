@@ -2,17 +2,71 @@
 Module for loading and inserting weather data into a SQLite database.
 """
 
-import os
 import csv
 import sqlite3
 from datetime import datetime
 from dataclasses import dataclass, field
 from contextlib import contextmanager
 from logging_config import logger
+from paths import BACKUP_DIR
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DB_DIR = os.path.join(BASE_DIR, "db")
-BACKUP_DIR = os.path.join(BASE_DIR, "app", "backup")
+# Statements are module-level constants so every call hands sqlite3 the same string,
+# which is the key of its per-connection compiled statement cache.
+CREATE_TABLE_SQL = """
+        CREATE TABLE IF NOT EXISTS Weather_data (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp DATETIME NOT NULL,
+            city VARCHAR(255) NOT NULL,
+            country VARCHAR(255) NOT NULL,
+            current_temperature REAL NOT NULL,
+            max_temperature REAL NOT NULL,
+            min_temperature REAL NOT NULL,
+            description TEXT NOT NULL,
+            cloud_percent INTEGER NOT NULL,
+            humidity INTEGER NOT NULL,
+            visibility INTEGER NOT NULL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        );
+"""
+
+CREATE_INDEX_SQL = """
+        CREATE INDEX IF NOT EXISTS idx_timestamp ON Weather_data(timestamp);
+"""
+
+INSERT_SQL = """
+        INSERT INTO Weather_data (
+            timestamp,
+            city,
+            country,
+            current_temperature,
+            max_temperature,
+            min_temperature,
+            description,
+            cloud_percent,
+            humidity,
+            visibility
+        )
+        VALUES (?,?,?,?,?,?,?,?,?,?);
+"""
+
+# Only the columns consumers need, in backup order. Rows are appended chronologically,
+# so walking the rowid backwards gives the newest records without touching idx_timestamp.
+SELECT_LATEST_SQL = """
+        SELECT
+            timestamp,
+            city,
+            country,
+            current_temperature,
+            max_temperature,
+            min_temperature,
+            description,
+            cloud_percent,
+            humidity,
+            visibility
+        FROM Weather_data
+        ORDER BY id DESC
+        LIMIT ?
+"""
 
 @dataclass
 class LoadData:
@@ -27,14 +81,27 @@ class LoadData:
 
     def __post_init__(self):
         """
-        Post-initialization to setup the database.
+        Post-initialization to open the shared connection and setup the database.
         """
+        self._conn = sqlite3.connect(self.db_file, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA cache_size=-8000;
+        """)
         self._init_database()
 
+        # Reuse one cursor with the constant INSERT_SQL so the compiled statement stays cached.
+        self._insert_cursor = self._conn.cursor()
+
     @contextmanager
     def get_connection(self):
         """
-        Context manager that provides a safe database connection.
+        Context manager that provides the shared database connection.
+
+        The connection stays open after the block exits; call `close` on shutdown.
 
         Yields:
             sqlite3.Connection: A SQLite connection with row factory set.
@@ -42,62 +109,40 @@ class LoadData:
         Raises:
             sqlite3.Error: If a database error occurs.
         """
-        conn = None
-
         try:
-            conn = sqlite3.connect(self.db_file)
-            conn.row_factory = sqlite3.Row
-            yield conn
+            yield self._conn
         except sqlite3.Error as e:
-            if conn:
-                conn.rollback()
-            logger.error(f'Error in data base: {e}')
+            if self._conn.in_transaction:
+                self._conn.rollback()
+            logger.error('Error in data base: %s', e)
             raise
-        finally:
-            if conn:
-                conn.close()
 
-    def _init_database(self):
+    def close(self):
         """
-        Initialize the database by creating tables and indexes if they do not already exist.
-        """
-        create_table_sql = """
-                CREATE TABLE IF NOT EXISTS Weather_data (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp DATETIME NOT NULL,
-                    city VARCHAR(255) NOT NULL,
-                    country VARCHAR(255) NOT NULL,
-                    current_temperature REAL NOT NULL,
-                    max_temperature REAL NOT NULL,
-                    min_temperature REAL NOT NULL,
-                    description TEXT NOT NULL,
-                    cloud_percent INTEGER NOT NULL,
-                    humidity INTEGER NOT NULL,
-                    visibility INTEGER NOT NULL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                );
+        Close the shared database connection.
         """
+        self._conn.close()
 
-        create_index_sql = """
-                CREATE INDEX IF NOT EXISTS idx_timestamp ON Weather_data(timestamp);
+    def _init_database(self):
+        """
+        Initialize the database by creating tables and indexes if they do not already exist.
         """
-
         try:
             with self.get_connection() as conn:
-                conn.execute(create_table_sql)
-                conn.execute(create_index_sql)
+                conn.execute(CREATE_TABLE_SQL)
+                conn.execute(CREATE_INDEX_SQL)
                 conn.commit()
                 logger.info('Data base initialized with success')
         except Exception as e:
-            logger.error(f'Error during initialization of data base: {e}')
+            logger.error('Error during initialization of data base: %s', e)
 
     def insert_weather_data(self, weather_info):
         """
         Insert a weather data record into the database.
 
         Args:
-            weather_info (dict): A dictionary containing the weather data. Expected keys:
-                - timestamp: Datetime of the record.
+            weather_info (WeatherRow): A tuple containing the weather data, in this order:
+                - timestamp: Datetime of the record as an ISO string.
                 - city: City name.
                 - country: Country name.
                 - current_temperature: Current temperature.
@@ -111,41 +156,33 @@ class LoadData:
         Raises:
             Exception: Propagates any exception encountered during database insertion.
         """
-        insert_info_sql = """
-                INSERT INTO Weather_data (
-                    timestamp,
-                    city,
-                    country,
-                    current_temperature,
-                    max_temperature,
-                    min_temperature,
-                    description,
-                    cloud_percent,
-                    humidity,
-                    visibility
-                )
-                VALUES (?,?,?,?,?,?,?,?,?,?);
+        self.insert_weather_data_many([weather_info])
+
+    def insert_weather_data_many(self, rows):
         """
+        Insert several weather data records into the database in a single transaction.
 
+        Args:
+            rows (Iterable[WeatherRow]): Weather data records with the same fields
+                                         expected by `insert_weather_data`.
+
+        Raises:
+            Exception: Propagates any exception encountered during database insertion.
+        """
         try:
+            # Records already follow the INSERT column order, so they bind as-is.
+            records = list(rows)
+
+            if not records:
+                return
+
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(insert_info_sql, (
-                    weather_info['timestamp'],
-                    weather_info['city'],
-                    weather_info['country'],
-                    weather_info['current_temperature'],
-                    weather_info['max_temperature'],
-                    weather_info['min_temperature'],
-                    weather_info['description'],
-                    weather_info['cloud_percentage'],
-                    weather_info['humidity'],
-                    weather_info['visibility']
-                ))
+                conn.execute('BEGIN')
+                self._insert_cursor.executemany(INSERT_SQL, records)
                 conn.commit()
-                logger.info('Meteorological data saved in DB successfully')
+                logger.info('Meteorological data saved in DB successfully - %d registers', len(records))
         except Exception as e:
-            logger.error(f'Error while inserting data to data base: {e}')
+            logger.error('Error while inserting data to data base: %s', e)
             raise
     
     def get_latest_records(self, limit=10):
@@ -156,24 +193,37 @@ class LoadData:
             limit (int): Maximum number of records to fetch. Defaults to 10.
 
         Returns:
-            list[sqlite3.Row]: List of weather records ordered by descending timestamp.
+            list[sqlite3.Row]: List of weather records newest first,
+                               with the same columns as the CSV backup.
                                Returns an empty list if an error occurs.
         """
-        select_records_sql = """
-                SELECT * FROM Weather_data
-                ORDER BY timestamp DESC
-                LIMIT ?
-        """
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(select_records_sql, (limit,))
+                cursor.execute(SELECT_LATEST_SQL, (limit,))
 
                 return cursor.fetchall()
         except Exception as e:
             logger.error('Error while consulting data')
             return []
 
+    def iter_latest_records(self, limit=10):
+        """
+        Stream the latest weather records from the database without materializing them.
+
+        Args:
+            limit (int): Maximum number of records to fetch. Defaults to 10.
+
+        Yields:
+            sqlite3.Row: Weather records newest first.
+                         Stops early, logging the error, if the query fails.
+        """
+        try:
+            with self.get_connection() as conn:
+                yield from conn.execute(SELECT_LATEST_SQL, (limit,))
+        except Exception as e:
+            logger.error('Error while consulting data')
+
     def initialize_backup(self, file_name='weather_backup.csv'):
         """
         Export recent weather data records to a CSV backup file.
@@ -187,11 +237,11 @@ class LoadData:
                              Defaults to 'weather_backup.csv'.
         """
         try:
-            records = self.get_latest_records(1000)
-            os.makedirs(BACKUP_DIR, exist_ok=True)
-            file_path = os.path.join(BACKUP_DIR, file_name)
+            records = self.iter_latest_records(1000)
+            file_path = BACKUP_DIR / file_name
 
-            if not records:
+            first_record = next(records, None)
+            if first_record is None:
                 logger.warning('No data to export')
                 return
             
@@ -204,12 +254,38 @@ class LoadData:
                     'humidity', 'visibility'
                 ]
 
-                writer = csv.DictWriter(csv_file, fieldnames=field_names)
-                writer.writeheader()
-
-                for record in records:
-                    writer.writerow(dict(record))
+                writer = csv.writer(csv_file)
+                writer.writerow(field_names)
+                writer.writerow(first_record)
+                writer.writerows(records)
                 
-                logger.info(f'Data exported to {file_name} - {len(records)} registers')
+                logger.info('Data exported to %s', file_name)
+        except Exception as e:
+            logger.error('Error while exporting to backup: %s', e)
+
+    def backup_database(self, file_name='weather_backup.db'):
+        """
+        Write a compacted snapshot of the whole database to the backup directory.
+
+        The copy is made by SQLite itself with `VACUUM INTO`, so no rows pass through
+        Python. The snapshot is written to a temporary file first and then moved over
+        the previous backup. No exceptions are raised; errors are logged instead.
+
+        Args:
+            file_name (str): Name of the database file to create.
+                             Defaults to 'weather_backup.db'.
+        """
+        try:
+            file_path = BACKUP_DIR / file_name
+            tmp_path = file_path.with_name(f'{file_name}.tmp')
+
+            # VACUUM INTO refuses to overwrite an existing file.
+            tmp_path.unlink(missing_ok=True)
+
+            with self.get_connection() as conn:
+                conn.execute('VACUUM INTO ?', (str(tmp_path),))
+
+            tmp_path.replace(file_path)
+            logger.info('Database snapshot saved to %s', file_name)
         except Exception as e:
-            logger.error(f'Error while exporting to backup: {e}')
+            logger.error('Error while creating database snapshot: %s', e)
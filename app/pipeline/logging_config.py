@@ -4,22 +4,64 @@ Module for configuring application logging.
 This module sets up the logging configuration using Python's built-in logging module.
 Logs are written both to a file and to the console. The log file is stored in a directory
 specified relative to the base directory of the project.
+
+Log records are put on an in-memory queue and written by a background listener thread,
+so logging calls never block on disk or console I/O. The log file is rotated at a fixed
+size and rotated files are gzip-compressed, which keeps disk usage bounded.
 """
 
 import os
+import gzip
+import queue
+import atexit
+import shutil
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from paths import LOG_DIR
+
+LOG_FILE = LOG_DIR / "app.log"
+LOG_MAX_BYTES = 5_000_000
+LOG_BACKUP_COUNT = 5
+
+def _gzip_namer(name):
+    """
+    Name rotated log files with a `.gz` suffix.
+    """
+    return f"{name}.gz"
+
+def _gzip_rotator(source, dest):
+    """
+    Compress the rotated log file into `dest` and remove the original.
+    """
+    with open(source, "rb") as log_file, gzip.open(dest, "wb") as gz_file:
+        shutil.copyfileobj(log_file, gz_file)
+    os.remove(source)
+
+formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-LOG_DIR = os.path.join(BASE_DIR, "pipeline", "log")
-LOG_FILE = os.path.join(LOG_DIR, "app.log")
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_FILE, encoding="utf-8"),
-        logging.StreamHandler()
-    ]
+file_handler = RotatingFileHandler(
+    LOG_FILE,
+    maxBytes=LOG_MAX_BYTES,
+    backupCount=LOG_BACKUP_COUNT,
+    encoding="utf-8"
 )
+file_handler.namer = _gzip_namer
+file_handler.rotator = _gzip_rotator
+file_handler.setFormatter(formatter)
+
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(formatter)
+
+log_queue = queue.Queue(-1)
+
+# Handlers are attached to the root logger directly: basicConfig would give the
+# QueueHandler its own formatter and format every record twice.
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(QueueHandler(log_queue))
+
+listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+listener.start()
+atexit.register(listener.stop)
 
 logger = logging.getLogger(__name__)
\ No newline at end of file
@@ -0,0 +1,16 @@
+"""
+Module with the filesystem locations used by the pipeline.
+
+Paths are resolved once, relative to the `app` directory, and the directories are
+created on import so the pipeline can start on a clean checkout.
+"""
+
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+LOG_DIR = BASE_DIR / "pipeline" / "log"
+DB_DIR = BASE_DIR / "db"
+BACKUP_DIR = BASE_DIR / "backup"
+
+for directory in (LOG_DIR, DB_DIR, BACKUP_DIR):
+    directory.mkdir(parents=True, exist_ok=True)
@@ -5,7 +5,8 @@ in a local SQLite database.
 
 Functions:
     job(db: LoadData):
-        Fetches weather data and inserts it into the database.
+        Fetches weather data for every configured city concurrently and inserts it into
+        the database in a single batch.
         
     main():
         Initializes the database, performs an initial data extraction, and schedules periodic
@@ -14,34 +15,55 @@ Functions:
 
 import os
 import schedule
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
 from dotenv import load_dotenv
 from icecream import ic
 from extract import extract_weather_data
-from load import LoadData, DB_DIR
+from load import LoadData
 from logging_config import logger
+from paths import DB_DIR
 
 # Load environment variables from the specified file.
 load_dotenv(dotenv_path='config/api_key.env')
-os.makedirs(DB_DIR, exist_ok=True)
 
 API_KEY = os.getenv('API_KEY')
 
-CITY = 'Codó'
-API_URL = f'https://api.openweathermap.org/data/2.5/weather?&q={CITY}&appid={API_KEY}&units=metric&lang=pt_br'
-DB_FILE = os.path.join(DB_DIR, "weather_data.db")
+CITIES = ('Codó',)
+API_URL = 'https://api.openweathermap.org/data/2.5/weather'
+API_PARAMS = {'units': 'metric', 'lang': 'pt_br'}
+MAX_WORKERS = 4  # Matches the HTTP connection pool size in extract.py.
+DB_FILE = str(DB_DIR / "weather_data.db")
 
 def job(db: LoadData):
     """
-    Execute a job to extract weather data and insert it into the database.
+    Execute a job to extract weather data for all cities and insert it into the database.
+
+    Requests are issued concurrently, so the job takes about as long as the slowest
+    response. Cities whose extraction fails are skipped; the error is logged by
+    `extract_weather_data`.
 
     Args:
         db (LoadData): The database interface for storing weather data.
     """
-    data = extract_weather_data(API_URL, API_KEY, CITY)
-    
-    if data:
-        db.insert_weather_data(data)
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(CITIES))) as executor:
+        futures = [
+            executor.submit(extract_weather_data, API_URL, API_KEY, city, API_PARAMS)
+            for city in CITIES
+        ]
+
+    rows = []
+    for future in futures:
+        try:
+            data = future.result()
+        except Exception:
+            continue
+
+        if data:
+            rows.append(data)
+
+    if rows:
+        db.insert_weather_data_many(rows)
 
 def main():
     """
@@ -49,30 +71,34 @@ def main():
     and schedule periodic tasks.
 
     Tasks:
-        - Extract current weather data and insert it into the database.
+        - Extract current weather data for every city and insert it into the database.
         - Schedule hourly weather data extraction.
         - Schedule weekly database backup every Sunday at midnight.
-        - Continuously run scheduled tasks until interrupted.
+        - Run scheduled tasks, sleeping until the next one is due, until interrupted.
     """
     logger.info('=== INITIALIZING METEOROLOGICAL DATA COLLECTOR ===')
+    db = None
 
     try:
         db = LoadData(DB_FILE)  # Initialize the database.
 
         logger.info('Executing the first data collection...')
-        info_data = extract_weather_data(API_URL, API_KEY, CITY)
-        db.insert_weather_data(info_data)
+        job(db)
 
         schedule.every(1).hours.do(job, db)
-        schedule.every().sunday.at("00:00").do(db.initialize_backup)
+        schedule.every().sunday.at("00:00").do(db.backup_database)
 
         while True:
             schedule.run_pending()
-            sleep(60)
+            # Sleep exactly until the next job is due instead of polling.
+            sleep(max(schedule.idle_seconds(), 0))
     except KeyboardInterrupt:
         logger.info('Program interrupted by user')
     except Exception as e:
-        logger.error(f'Error in the main program: {e}')
+        logger.error('Error in the main program: %s', e)
+    finally:
+        if db is not None:
+            db.close()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file